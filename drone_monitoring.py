@@ -1,46 +1,284 @@
 import streamlit as st
 import pandas as pd
-import pydeck as pdk
-import plotly.express as px
+import numpy as np
+import pyarrow.parquet as pq
+import streamlit.components.v1 as components
 import time
+import os
+import tempfile
+import math
+import io
+import base64
+from PIL import Image
 
 # Set the page configuration
 st.set_page_config(layout="wide", page_title="Military Drone Dashboard", page_icon=":airplane:")
 
-# Optimized and Cached Data Loading
-@st.cache_data
-def load_drone_anomalies(path):
-    return pd.read_csv(path).head(100)  # Load only the first 100 rows for optimization
-
-# File Paths
-drone_anomaly_path = "drone_anomaly_actions.csv"
-
-# Load Data
-drone_anomalies = load_drone_anomalies(drone_anomaly_path)
-
-# Map Data Preparation
-map_data = drone_anomalies.copy()
-
 # Convert Threat Levels to Numeric Weights for Heatmap
 threat_level_weights = {"High": 3, "Medium": 2, "Low": 1}
-map_data["weight"] = map_data["threat_level"].map(threat_level_weights)
+
+# Convert Threat Levels to RGBA Colors for Scatterplot
+threat_level_colors = {"High": [255, 0, 0, 160], "Medium": [255, 165, 0, 160], "Low": [0, 128, 0, 160]}
+
+# Anomaly Columns Used by the Dashboard and Their Dtypes
+anomaly_dtypes = {
+    "longitude": "float32",
+    "latitude": "float32",
+    "threat_level": "category",
+    "anomaly_type": "category",
+    "recommended_action": "category",
+}
+
+# Optimized and Cached Data Loading (derived map columns are computed once here)
+# cache_resource hands back the same frame each rerun instead of an unpickled copy;
+# map_data is treated as read-only below; data_version (the Parquet mtime) keys the cache
+@st.cache_resource
+def load_drone_anomalies(path, data_version):
+    # Read only the columns the dashboard uses; memory mapping lets the OS page in just those
+    table = pq.read_table(path, columns=list(anomaly_dtypes), memory_map=True)
+    df = table.to_pandas().astype(anomaly_dtypes)
+    # Rows without a threat level can't be weighted or colored (their code would be -1)
+    df = df[df["threat_level"].notna()].reset_index(drop=True)
+    # Look up weights and colors per category, then gather them by the category codes
+    categories = df["threat_level"].cat.categories
+    unknown_levels = [c for c in categories if c not in threat_level_weights or c not in threat_level_colors]
+    if unknown_levels:
+        raise ValueError(f"Unknown threat levels in {path}: {unknown_levels}; expected one of {list(threat_level_weights)}")
+    codes = df["threat_level"].cat.codes.to_numpy()
+    weight_lut = np.array([threat_level_weights[c] for c in categories], dtype=np.int8)
+    rgba_lut = np.array([threat_level_colors[c] for c in categories], dtype=np.uint8)
+    df["weight"] = weight_lut[codes]
+    df["color"] = rgba_lut[codes].tolist()  # deck.gl reads one RGBA list per row
+    return df
+
+# File Paths
+drone_anomaly_csv_path = "drone_anomaly_actions.csv"
+drone_anomaly_path = "drone_anomaly_actions.parquet"
+
+# Convert the CSV to Parquet once (again only if the CSV is newer), keeping the first 100 rows
+# Sessions run in concurrent threads, so write to a temp file and swap it in atomically;
+# readers then only ever see the old file or the complete new one
+def convert_anomalies_to_parquet(csv_path, parquet_path):
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(parquet_path)), suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        pd.read_csv(csv_path, nrows=100).to_parquet(tmp_path, index=False, compression="zstd")
+        os.replace(tmp_path, parquet_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+convert_anomalies_to_parquet(drone_anomaly_csv_path, drone_anomaly_path)
+
+# Data Version (changes whenever the Parquet copy is regenerated, invalidating the caches below)
+drone_anomaly_version = os.path.getmtime(drone_anomaly_path)
+
+# Load Data (already carries the heatmap weights and scatterplot colors)
+map_data = load_drone_anomalies(drone_anomaly_path, drone_anomaly_version)
+
+# Heatmap Grid Covering the Lahad Datu Anomaly Area
+heatmap_bounds = [118.0, 4.8, 119.0, 5.3]  # [west, south, east, north]
+heatmap_grid_shape = (100, 200)  # (rows, cols), roughly 550 m cells
+
+# Sum anomaly weights into a lat/lon grid
+# (serial on purpose: a prange loop would race on shared grid cells)
+def _bin_anomalies_py(lon, lat, w, nx, ny, lon0, lat0, dlon, dlat):
+    grid = np.zeros((ny, nx), np.float32)
+    for i in range(lon.size):
+        ix = math.floor((lon[i] - lon0) / dlon)
+        iy = math.floor((lat[i] - lat0) / dlat)
+        if 0 <= ix < nx and 0 <= iy < ny:  # Drop points outside the grid
+            grid[iy, ix] += w[i]
+    return grid
+
+# Optional Numba JIT for the binning kernel, imported on first use to keep it off the cold start;
+# compiled once per process and cached on disk, falling back to plain Python without Numba
+@st.cache_resource
+def _compiled_binner():
+    try:
+        from numba import njit
+    except ImportError:
+        return _bin_anomalies_py
+    return njit(cache=True)(_bin_anomalies_py)
+
+# deck.gl's default HeatmapLayer color range, reused for the pre-binned heatmap image
+heatmap_color_range = np.array([
+    [255, 255, 178], [254, 217, 118], [254, 178, 76],
+    [253, 141, 60], [240, 59, 32], [189, 0, 38],
+], dtype=np.float32)
+
+# Separable Gaussian blur in plain NumPy (stands in for the GPU kernel density pass)
+def _gaussian_blur(grid, sigma):
+    radius = int(3 * sigma)
+    offsets = np.arange(-radius, radius + 1, dtype=np.float32)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel /= kernel.sum()
+    grid = np.apply_along_axis(np.convolve, 0, grid, kernel, mode="same")
+    return np.apply_along_axis(np.convolve, 1, grid, kernel, mode="same")
+
+# Cached Heatmap Image (binned, blurred and colored once per data version, then shipped as a PNG data URL)
+@st.cache_data
+def build_heatmap_image(data_version, sigma=5, threshold=0.2):
+    ny, nx = heatmap_grid_shape
+    west, south, east, north = heatmap_bounds
+    grid = _compiled_binner()(
+        map_data["longitude"].to_numpy(), map_data["latitude"].to_numpy(),
+        map_data["weight"].to_numpy(np.float32),
+        nx, ny, west, south, (east - west) / nx, (north - south) / ny,
+    )
+    density = _gaussian_blur(grid, sigma)
+    if density.max() > 0:
+        density /= density.max()
+
+    # Interpolate each channel along the color range; fade in up to the threshold
+    stops = np.linspace(0, 1, len(heatmap_color_range))
+    rgba = np.empty((ny, nx, 4), dtype=np.uint8)
+    for channel in range(3):
+        rgba[..., channel] = np.interp(density, stops, heatmap_color_range[:, channel])
+    rgba[..., 3] = np.clip(density / threshold, 0, 1) * 200
+
+    # Image rows run north to south, grid rows south to north
+    buffer = io.BytesIO()
+    Image.fromarray(np.flipud(rgba), "RGBA").save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+# Custom CSS to Disable Video Interactions
+disable_hover_css = """
+<style>
+video {
+    pointer-events: none; /* Disable all mouse interactions */
+    user-select: none;    /* Prevent text selection */
+    outline: none;        /* Disable focus outlines */
+}
+</style>
+"""
+
+# Video Sources (fixed URLs so each rerun emits an identical st.video element)
+normal_video_url = "https://i.imgur.com/h4ghtfH.mp4"
+surveillance_video_url = "https://i.imgur.com/o64VTM8.mp4"
 
 # Function to Display Videos
+# Call on every rerun at the same position with the same arguments: Streamlit then
+# keeps the existing <video> node, whereas skipping the call would unmount it
 def show_video(header, video_url, autoplay=True, muted=False, loop=False):
-    disable_hover_css = """
-    <style>
-    video {
-        pointer-events: none; /* Disable all mouse interactions */
-        user-select: none;    /* Prevent text selection */
-        outline: none;        /* Disable focus outlines */
-    }
-    </style>
-    """
-    # Display the custom CSS once
-    st.markdown(disable_hover_css, unsafe_allow_html=True)
     st.subheader(header)
     st.video(video_url, autoplay=autoplay, muted=muted, loop=loop)
 
+# Static Table Rows (module-level tuples, built into DataFrames once below)
+drone_status_columns = ["Drone ID", "Missions", "Status", "Team"]
+drone_status_rows = (
+    ("CTRM Aludra", "OPS Daulat", "Active", "PASKAU"),
+    ("CTRM Aludra", "Maritime Surveillance", "Active", "No. 22 Skuadron"),
+    ("CTRM Aludra", "OPS Merpati", "Finished", "Kor Armor Diraja"),
+    ("CTRM Aludra", "OPS Taring", "Finished", "PASKAU"),
+    ("CTRM Aludra", "Border Control Operations", "Finished", "Tentera Darat Udara"),
+)
+
+coa_columns = ["COA", "Recommended Action", "Execution Time", "Sucess Rate(%)"]
+coa_rows = (
+    ("COA 1", "Deploy drones to monitor high-threat anomalies.", "15 mins", "87.3"),
+    ("COA 2", "Coordinate ground units to investigate specific points of interest.", "45 mins", "56.2"),
+    ("COA 3", "Use electronic warfare to disrupt potential threats.", "30 mins", "78.9"),
+)
+
+log_columns = ["Timestamp", "Action"]
+log_rows = (
+    ("2024-11-28 03:01", "CTRM Aludra deployed to Sector 1-5"),
+    ("2024-11-27 12:10", "Signal lost for CTRM Aludra"),
+    ("2024-11-27 02:13", "CTRM Aludra returned to base"),
+    ("2024-11-27 01:40", "CTRM Aludra deployed to Sector 12-7"),
+    ("2024-11-26 23:56", "Signal lost for CTRM Aludra"),
+    ("2024-11-14 03:12", "CTRM Aludra returned to base"),
+    ("2024-11-14 02:30", "CTRM Aludra deployed to Sector 5-11"),
+    ("2024-11-05 17:20", "CTRM Aludra signal interupted"),
+    ("2024-10-15 23:55", "CTRM Aludra returned to base"),
+    ("2024-10-25 23:14", "Signal lost for CTRM Aludra"),
+    ("2024-10-14 22:53", "CTRM Aludra deployed to Sector 3-2"),
+)
+
+# Cached Static Tables
+@st.cache_data
+def build_drone_status():
+    return pd.DataFrame.from_records(drone_status_rows, columns=drone_status_columns)
+
+@st.cache_data
+def build_coa_data():
+    return pd.DataFrame.from_records(coa_rows, columns=coa_columns)
+
+@st.cache_data
+def build_log_df():
+    return pd.DataFrame.from_records(log_rows, columns=log_columns)
+
+# Cached Charts (built directly with graph_objects; cache_resource skips pickling the figures)
+# Plotly is imported on first build rather than at startup
+@st.cache_resource
+def build_resource_chart():
+    import plotly.graph_objects as go
+    resources = ["Battery", "Ammunition", "Surveillance Time", "Maintenance Parts", 
+    "Fuel/Propellant", "Weapon Systems", "Data Bandwidth", "Sensor Utilization", 
+    "Cooling System", "Flight Hours"]
+    usages = [600, 300, 450, 200, 400, 250, 100, 350, 150, 500]
+    fig = go.Figure(go.Bar(x=resources, y=usages))
+    fig.update_layout(title="Resource Consumption", xaxis_title="Resource", yaxis_title="Usage")
+    return fig
+
+@st.cache_resource
+def build_casualties_chart():
+    import plotly.graph_objects as go
+    phases = ["Phase 1", "Phase 2", "Phase 3"]
+    probabilities = [10, 25, 5]
+    fig = go.Figure(go.Scattergl(x=phases, y=probabilities, mode="lines"))  # WebGL line trace
+    fig.update_layout(title="Probability of Casualties", xaxis_title="Operation Phase", yaxis_title="Probability (%)")
+    return fig
+
+# Columns Serialized for the Scatterplot (everything else stays out of the deck JSON)
+scatterplot_columns = ["longitude", "latitude", "color", "anomaly_type", "threat_level", "recommended_action"]
+
+# Shared Deck Settings (identical for both layers)
+view_state_settings = {"latitude": 5.05, "longitude": 118.25, "zoom": 10, "pitch": 40}
+deck_tooltip = {
+    "html": """
+        <b>Anomaly Type:</b> {anomaly_type}<br>
+        <b>Threat Level:</b> {threat_level}<br>
+        <b>Recommended Action:</b> {recommended_action}
+    """,
+    "style": {"backgroundColor": "steelblue", "color": "white"}
+}
+deck_map_style = "mapbox://styles/mapbox/dark-v10"
+
+# Cached Pydeck Maps (one per layer, rebuilt when data_version changes)
+# Pydeck is imported on first build rather than at startup
+@st.cache_resource
+def heatmap_deck(data_version):
+    import pydeck as pdk
+    layer = pdk.Layer(
+        "BitmapLayer",
+        image=build_heatmap_image(data_version),  # Pre-binned heatmap; deck.gl only composites the image
+        bounds=heatmap_bounds,
+    )
+    return pdk.Deck(layers=[layer], initial_view_state=pdk.ViewState(**view_state_settings), tooltip=deck_tooltip, map_style=deck_map_style)
+
+@st.cache_resource
+def scatterplot_deck(data_version):
+    import pydeck as pdk
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=map_data[scatterplot_columns],
+        get_position=["longitude", "latitude"],
+        get_color="color",  # Use precomputed RGBA colors
+        get_radius=1000,
+        pickable=True,
+    )
+    return pdk.Deck(layers=[layer], initial_view_state=pdk.ViewState(**view_state_settings), tooltip=deck_tooltip, map_style=deck_map_style)
+
+# Cached Standalone Map HTML (bypasses the st.pydeck_chart bridge on reruns)
+@st.cache_data
+def build_deck_html(layer_option, data_version):
+    map_deck = heatmap_deck(data_version) if layer_option == "Heatmap" else scatterplot_deck(data_version)
+    return map_deck.to_html(as_string=True, notebook_display=False)
+
 # Session State Initialization
 if "alert_triggered" not in st.session_state:
     st.session_state.alert_triggered = False
@@ -51,91 +289,28 @@ if "show_surveillance" not in st.session_state:
 if "coa_selected" not in st.session_state:
     st.session_state.coa_selected = None
 
-# Dashboard Layout
-st.title("CTRM Aludra Operations Dashboard")
-st.markdown("""
-This dashboard provides real-time insights into drone operations, including anomaly detection, 
-risk assessment, and executing Courses of Action (COAs) for the Lahad Datu region.
-""")
-
-# Layout: Left Panel (Drone Status, Statistics) | Right Panel (Map, COAs, Logs)
-left_col, right_col = st.columns([2, 1.5])
-
-# === Left Panel: Drone Status and Statistics ===
-with left_col:
-
-    st.header("Drone Activity Status")
-    drone_status = pd.DataFrame({
-        "Drone ID": ["CTRM Aludra", "CTRM Aludra", "CTRM Aludra", "CTRM Aludra", "CTRM Aludra"],
-        "Missions": ["OPS Daulat", "Maritime Surveillance", "OPS Merpati", "OPS Taring", "Border Control Operations"],
-        "Status": ["Active", "Active", "Finished", "Finished", "Finished"],
-        "Team": ["PASKAU", "No. 22 Skuadron", "Kor Armor Diraja", "PASKAU", "Tentera Darat Udara"],
-    })
-    st.table(drone_status)
+if "monitor_start" not in st.session_state:
+    st.session_state.monitor_start = None
 
+# Dashboard Panels (fragments rerun on their own widget changes, not the whole script)
+@st.fragment
+def map_panel():
     st.header("Mission Map and Anomalies")
 
     # Map Layer Toggle
     layer_option = st.radio("Select Map Layer", options=["Heatmap", "Scatterplot"], index=0)
 
     # Pydeck Map Configuration
-    view_state = pdk.ViewState(latitude=5.05, longitude=118.25, zoom=10, pitch=40)
-
-    if layer_option == "Heatmap":
-        layer = pdk.Layer(
-            "HeatmapLayer",
-            data=map_data,
-            get_position=["longitude", "latitude"],
-            get_weight="weight",  # Use numeric weights
-            intensity=10,
-            radius_pixels=60,
-            threshold=0.2,
-        )
-    else:  # Scatterplot Layer
-        layer = pdk.Layer(
-            "ScatterplotLayer",
-            data=map_data,
-            get_position=["longitude", "latitude"],
-            get_color=[
-                "255, 0, 0, 160" if threat_level == "High" 
-                else "255, 165, 0, 160" if threat_level == "Medium" 
-                else "0, 128, 0, 160" 
-                for threat_level in map_data["threat_level"]
-            ],
-            get_radius=1000,
-            pickable=True,
-        )
-
-    map_deck = pdk.Deck(
-        layers=[layer],
-        initial_view_state=view_state,
-        tooltip={
-            "html": """
-                <b>Anomaly Type:</b> {anomaly_type}<br>
-                <b>Threat Level:</b> {threat_level}<br>
-                <b>Recommended Action:</b> {recommended_action}
-            """,
-            "style": {"backgroundColor": "steelblue", "color": "white"}
-        },
-        map_style="mapbox://styles/mapbox/dark-v10",
-    )
-    st.pydeck_chart(map_deck)
+    map_html = build_deck_html(layer_option, drone_anomaly_version)
+    components.html(map_html, height=500)
 
-    # === COA Actions and Recommendations(Detailed) ===
+@st.fragment
+def coa_panel():
     st.header("CTRM Aludra COA & Strategies Selection")
 
     # COA Data
-    coa_data = pd.DataFrame({
-        "COA": ["COA 1", "COA 2", "COA 3"],
-        "Recommended Action": [
-            "Deploy drones to monitor high-threat anomalies.",
-            "Coordinate ground units to investigate specific points of interest.",
-            "Use electronic warfare to disrupt potential threats."
-        ],
-        "Execution Time": ["15 mins", "45 mins", "30 mins"],
-        "Sucess Rate(%)": ["87.3", "56.2", "78.9"]
-    })
-    st.table(coa_data)
+    coa_data = build_coa_data()
+    st.dataframe(coa_data, hide_index=True, use_container_width=True)
 
     # COA Selection
     chosen_coa = st.radio("Choose a COA to execute", options=["COA 1", "COA 2", "COA 3"], index=0)
@@ -145,71 +320,39 @@ with left_col:
         st.session_state.coa_selected = chosen_coa
         st.session_state.alert_triggered = False  # Reset alert
         st.session_state.show_surveillance = False  # Reset surveillance
-        st.success(f"Executing {chosen_coa}: {coa_data.loc[coa_data['COA'] == chosen_coa, 'Recommended Action'].values[0]}")
+        st.session_state.monitor_start = time.time()  # Start monitoring window
+        st.rerun()  # Full rerun so the monitoring panel picks up the new COA
 
-# === Right Panel: Map, COA Generation, Suspicious Activity Monitoring, and Logs ===
-with right_col:
-    with st.container(border=True):
-        st.header("Statistics and Insights")
-        # Resource Consumption Chart
-        resource_data = pd.DataFrame({
-            "Resource": ["Battery", "Ammunition", "Surveillance Time", "Maintenance Parts", 
-            "Fuel/Propellant", "Weapon Systems", "Data Bandwidth", "Sensor Utilization", 
-            "Cooling System", "Flight Hours"],
-            "Usage": [600, 300, 450, 200, 400, 250, 100, 350, 150, 500]
-        })
-        resource_chart = px.bar(resource_data, x="Resource", y="Usage", title="Resource Consumption")
-        st.plotly_chart(resource_chart, use_container_width=True)
+    if st.session_state.coa_selected:
+        executing_coa = st.session_state.coa_selected
+        st.success(f"Executing {executing_coa}: {coa_data.loc[coa_data['COA'] == executing_coa, 'Recommended Action'].values[0]}")
 
-    with st.container(border=True):
-        # Probability of Casualties
-        casualties_data = pd.DataFrame({
-            "Operation Phase": ["Phase 1", "Phase 2", "Phase 3"],
-            "Probability (%)": [10, 25, 5]
-        })
-        casualties_chart = px.line(casualties_data, x="Operation Phase", y="Probability (%)", title="Probability of Casualties")
-        st.plotly_chart(casualties_chart, use_container_width=True)
-
-        # === Drone Logs ===
-    st.header("CTRM Aludra Logs")
-    log_data = [
-        {"Timestamp": "2024-11-28 03:01", "Action": "CTRM Aludra deployed to Sector 1-5"},
-        {"Timestamp": "2024-11-27 12:10", "Action": "Signal lost for CTRM Aludra"},
-        {"Timestamp": "2024-11-27 02:13", "Action": "CTRM Aludra returned to base"},
-        {"Timestamp": "2024-11-27 01:40", "Action": "CTRM Aludra deployed to Sector 12-7"},
-        {"Timestamp": "2024-11-26 23:56", "Action": "Signal lost for CTRM Aludra"},
-        {"Timestamp": "2024-11-14 03:12", "Action": "CTRM Aludra returned to base"},
-        {"Timestamp": "2024-11-14 02:30", "Action": "CTRM Aludra deployed to Sector 5-11"},
-        {"Timestamp": "2024-11-05 17:20", "Action": "CTRM Aludra signal interupted"},
-        {"Timestamp": "2024-10-15 23:55", "Action": "CTRM Aludra returned to base"},
-        {"Timestamp": "2024-10-25 23:14", "Action": "Signal lost for CTRM Aludra"},
-        {"Timestamp": "2024-10-14 22:53", "Action": "CTRM Aludra deployed to Sector 3-2"}
-    ]
-    log_df = pd.DataFrame(log_data)
-    st.table(log_df)
-    
-
-left_col2, right_col2 = st.columns([1, 2])
+@st.fragment
+def monitoring_panel():
+    # Inject the video CSS once per run alongside the videos: Streamlit drops elements a rerun
+    # doesn't re-emit, so the style can't be sent only once per session
+    st.markdown(disable_hover_css, unsafe_allow_html=True)
 
-# === Suspicious Activity Monitoring ===
-if st.session_state.get("coa_selected"):
+    left_col2, right_col2 = st.columns([1, 2])
 
     with left_col2:
         st.header("Drone Activity Monitoring")
 
         # Show "Normal Operation" video
-        show_video("Normal Operation", "https://i.imgur.com/h4ghtfH.mp4", autoplay=True, loop=True)
+        show_video("Normal Operation", normal_video_url, autoplay=True, loop=True)
 
         # Create a placeholder for the countdown
         countdown_placeholder = st.empty()
 
-        # Simulate monitoring with a countdown
-        for remaining_time in range(10, 0, -1):
-            countdown_placeholder.info(f"Monitoring Selected Perimeter...")
-            time.sleep(1)
+        # Simulate monitoring: render once, then wait out whatever is left of the
+        # 10 second window so reruns resume the countdown instead of restarting it
+        if not st.session_state.alert_triggered:
+            countdown_placeholder.info("Monitoring Selected Perimeter...")
+            elapsed = time.time() - st.session_state.monitor_start
+            time.sleep(max(0, 10 - elapsed))
 
-        # Trigger alert
-        st.session_state.alert_triggered = True
+            # Trigger alert
+            st.session_state.alert_triggered = True
 
         # Update the placeholder to show the alert
         countdown_placeholder.warning("⚠️ Suspicious activity detected!")
@@ -225,6 +368,51 @@ if st.session_state.get("coa_selected"):
                 # Show surveillance video
                 show_video(
                     "Suspicious Activity Detected",
-                    "https://i.imgur.com/o64VTM8.mp4",
+                    surveillance_video_url,
                     autoplay=True, loop=True
                 )
+
+# Dashboard Layout
+st.title("CTRM Aludra Operations Dashboard")
+st.markdown("""
+This dashboard provides real-time insights into drone operations, including anomaly detection, 
+risk assessment, and executing Courses of Action (COAs) for the Lahad Datu region.
+""")
+
+# Layout: Left Panel (Drone Status, Statistics) | Right Panel (Map, COAs, Logs)
+left_col, right_col = st.columns([2, 1.5])
+
+# === Left Panel: Drone Status and Statistics ===
+with left_col:
+
+    st.header("Drone Activity Status")
+    drone_status = build_drone_status()
+    st.dataframe(drone_status, hide_index=True, use_container_width=True)
+
+    map_panel()
+
+    # === COA Actions and Recommendations(Detailed) ===
+    coa_panel()
+
+# === Right Panel: Map, COA Generation, Suspicious Activity Monitoring, and Logs ===
+with right_col:
+    with st.container(border=True):
+        st.header("Statistics and Insights")
+        # Resource Consumption Chart
+        resource_chart = build_resource_chart()
+        st.plotly_chart(resource_chart, use_container_width=True)
+
+    with st.container(border=True):
+        # Probability of Casualties
+        casualties_chart = build_casualties_chart()
+        st.plotly_chart(casualties_chart, use_container_width=True)
+
+        # === Drone Logs ===
+    st.header("CTRM Aludra Logs")
+    log_df = build_log_df()
+    st.dataframe(log_df, hide_index=True, use_container_width=True)
+    
+
+# === Suspicious Activity Monitoring ===
+if st.session_state.get("coa_selected"):
+    monitoring_panel()